@@ -3,42 +3,197 @@
 
 import tkinter as tk
 from tkinter import messagebox
+from array import array
+import threading
 import time
 
 
-# Grid storage: 0 empty, -1 wall, >0 cost
+# Grid storage: 0 empty, -1 wall, >0 cost (up to 127)
+# cells live in one flat row-major array of signed bytes,
+# index = row * width + col
 
 class GridGraph:
+    DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    # byte -> '0' for a wall (-1 is 0xff), '1' for anything else
+    _OPEN_DIGITS = bytes(b'0'[0] if b == 0xff else b'1'[0] for b in range(256))
+    # bytes of cells that are not a cost: 0 and every negative value
+    _NOT_COST = bytes([0]) + bytes(range(0x80, 0x100))
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        self.size = width * height
+        self.cells = array('b', bytes(self.size))
+        self.wall_count = 0
+        self.weighted_count = 0  # cells with a cost > 0
+        self._open_bits = None
+        self._neighbors = None
+        self._weighted = None
     
     def set_cell(self, row, col, value):
         if 0 <= row < self.height and 0 <= col < self.width:
-            self.grid[row][col] = value
+            idx = row * self.width + col
+            old = self.cells[idx]
+            # write first: a cost above 127 raises OverflowError here, and
+            # then the counters and cached tables must still match the cells
+            self.cells[idx] = value
+            self._open_bits = None
+            self._neighbors = None
+            self._weighted = None
+            if old == -1:
+                self.wall_count -= 1
+            elif old > 0:
+                self.weighted_count -= 1
+            if value == -1:
+                self.wall_count += 1
+            elif value > 0:
+                self.weighted_count += 1
+
+    def fill_row(self, row, value):
+        # whole row in one slice assignment
+        width = self.width
+        self.cells[row * width:(row + 1) * width] = array('b', [value]) * width
+        self._bulk_changed()
+
+    def fill_col(self, col, value):
+        # every width-th cell starting at col is that column
+        self.cells[col::self.width] = array('b', [value]) * self.height
+        self._bulk_changed()
+
+    def _bulk_changed(self):
+        # after writing many cells at once: recount, drop cached views
+        self.wall_count = self.cells.count(-1)
+        # only cost > 0 counts, same rule as set_cell (other negative values
+        # are walked like empty cells); deleting the rest is done in C
+        self.weighted_count = len(self.cells.tobytes().translate(None, self._NOT_COST))
+        self._open_bits = None
+        self._neighbors = None
+        self._weighted = None
+
+    def is_uniform_cost(self):
+        # every step costs 1 (no weighted cells), O(1) thanks to the counter
+        return self.weighted_count == 0
+
+    def is_fully_open(self):
+        # no walls at all (costs don't matter for BFS)
+        return self.wall_count == 0
     
     def get_cell(self, row, col):
         if 0 <= row < self.height and 0 <= col < self.width:
-            return self.grid[row][col]
+            return self.cells[row * self.width + col]
         return None
-    
+
+    @classmethod
+    def from_cells(cls, width, height, cells):
+        # wrap an existing flat row-major array('b') as the grid, no copy
+        # (anything else, e.g. bytes or a list of values, gets converted);
+        # raw() gives the same array back
+        if not isinstance(cells, array) or cells.typecode != 'b':
+            cells = array('b', cells)
+        if len(cells) != width * height:
+            raise ValueError(f"expected {width * height} cells, got {len(cells)}")
+        grid = cls(width, height)
+        grid.cells = cells
+        grid._bulk_changed()
+        return grid
+
+    def copy(self):
+        # independent grid with the same cells (for background searches)
+        return GridGraph.from_cells(self.width, self.height, array('b', self.cells))
+
+    def flat(self, row, col):
+        # (row, col) -> index into cells and into the searches' flat lists
+        return row * self.width + col
+
+    def unflat(self, idx):
+        return divmod(idx, self.width)
+
+    def open_bits(self):
+        # whole grid as one int, bit (row * width + col) set if walkable
+        # (built from the bytes in C, cached until the next set_cell)
+        if self._open_bits is None:
+            digits = self.cells.tobytes().translate(self._OPEN_DIGITS)[::-1]
+            self._open_bits = int(digits, 2) if digits else 0
+        return self._open_bits
+
+    def neighbor_table(self):
+        # for every cell, a tuple with the flat indices of its walkable
+        # neighbours (empty for walls); built once and reused by every
+        # search until the grid changes, so the search loops don't do
+        # bounds or wall checks
+        if self._neighbors is None:
+            cells = self.cells
+            width = self.width
+            last_row = self.height - 1
+            last_col = width - 1
+            table = []
+            for idx in range(self.size):
+                if cells[idx] == -1:
+                    table.append(())
+                    continue
+                row, col = divmod(idx, width)
+                table.append(tuple(n_idx for n_idx, inside in ((idx - width, row > 0),
+                                                               (idx + width, row < last_row),
+                                                               (idx - 1, col > 0),
+                                                               (idx + 1, col < last_col))
+                                   if inside and cells[n_idx] != -1))
+            self._neighbors = table
+        return self._neighbors
+
+    def weighted_neighbor_table(self):
+        # like neighbor_table, but each neighbour comes with the cost of
+        # stepping onto it: (index, cost) pairs, walls already left out,
+        # so Dijkstra/A* don't look at the cell value per edge
+        if self._weighted is None:
+            cells = self.cells
+            step = [cell if cell > 0 else 1 for cell in cells]
+            self._weighted = [tuple((n_idx, step[n_idx]) for n_idx in adjacent)
+                              for adjacent in self.neighbor_table()]
+        return self._weighted
+
+    def make_frontier(self):
+        # queue buffer for a flat-index BFS plus its head/tail; every cell is
+        # queued at most once, so size slots never run out. A new buffer per
+        # call (filled in C, cheap next to the search), so searches on the
+        # same grid from different threads never share a queue
+        return [0] * self.size, 0, 0
+
+    def raw(self):
+        # the flat cell array itself (no copy), used by the search loops
+        return self.cells
+
+    def rows(self):
+        # one list per row, handy for printing
+        return [self.cells[r * self.width:(r + 1) * self.width].tolist()
+                for r in range(self.height)]
+
+    @property
+    def grid(self):
+        # the old list-of-lists view, grid[row][col], for code that still
+        # reads it; a fresh copy each time, so writes must go through set_cell
+        return self.rows()
+
     def is_walkable(self, row, col):
         cell = self.get_cell(row, col)
         return cell is not None and cell != -1
     
     def get_neighbors(self, row, col):
+        # reads the flat array directly, no get_cell/is_walkable call per side
+        cells = self.cells
+        width = self.width
+        height = self.height
         neighbors = []
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        for dr, dc in self.DIRECTIONS:
             new_row, new_col = row + dr, col + dc
-            if self.is_walkable(new_row, new_col):
+            if (0 <= new_row < height and 0 <= new_col < width
+                    and cells[new_row * width + new_col] != -1):
                 neighbors.append((new_row, new_col))
         return neighbors
     
     def get_cost(self, row, col):
-        cell = self.get_cell(row, col)
-        if cell is None:
+        if not (0 <= row < self.height and 0 <= col < self.width):
             return 0
+        cell = self.cells[row * self.width + col]
         if cell == 0:
             return 1
         elif cell > 0:
@@ -53,7 +208,15 @@ class PathFinder:
         self.grid = grid_graph
         self.width = grid_graph.width
         self.height = grid_graph.height
-        self.size = self.width * self.height
+        self.size = grid_graph.size
+        # larger than any real path cost (a cell costs at most 127), as an
+        # int so the distance compares in the loops stay int against int
+        self.unreached = 127 * self.size + 1
+        self.explored_nodes = 0
+
+    def reset(self):
+        # per-search state; the searches allocate their own lists, so a
+        # finder can be reused for as many searches on its grid as needed
         self.explored_nodes = 0
 
     def index(self, row, col):
@@ -63,104 +226,298 @@ class PathFinder:
         return divmod(idx, self.width)
 
     def reconstruct_path(self, parent, start_idx, goal_idx):
-        path = []
+        # collect plain indices (no tuple per step, no self.pos call), then
+        # turn them into (row, col) in one comprehension, already reversed
+        chain = [goal_idx]
+        append = chain.append
         current = goal_idx
-        while current != -1:
-            path.append(self.pos(current))
-            if current == start_idx:
-                break
+        while current != start_idx:
             current = parent[current]
-        if not path or current == -1:
-            return None
-        path.reverse()
-        return path
+            if current == -1:
+                return None
+            append(current)
+        width = self.width
+        return [divmod(idx, width) for idx in reversed(chain)]
 
 
 class MinHeap:
-    # small min-heap for (priority, item)
+    # small min-heap of plain ints; the searches pack (priority, cell) into
+    # one key, priority << shift | cell, so a single int compare orders by
+    # priority first and no tuples are built or indexed
+    __slots__ = ('data',)
+
     def __init__(self):
         self.data = []
 
     def __len__(self):
         return len(self.data)
 
-    def push(self, priority, item):
-        self.data.append((priority, item))
+    def push(self, key):
+        self.data.append(key)
         self._bubble_up(len(self.data) - 1)
 
     def pop(self):
-        if not self.data:
-            return None, None
-        self._swap(0, len(self.data) - 1)
-        priority, item = self.data.pop()
-        if self.data:
-            self._bubble_down(0)
-        return priority, item
-
-    def _swap(self, i, j):
-        self.data[i], self.data[j] = self.data[j], self.data[i]
+        data = self.data
+        if not data:
+            return None
+        # the last key fills the root's hole, no swap needed
+        last = data.pop()
+        if not data:
+            return last
+        top = data[0]
+        data[0] = last
+        self._bubble_down(0)
+        return top
 
     def _bubble_up(self, idx):
+        # move a "hole" up instead of swapping, the key is written once
+        data = self.data
+        key = data[idx]
         while idx > 0:
-            parent = (idx - 1) // 2
-            if self.data[parent][0] <= self.data[idx][0]:
+            parent = (idx - 1) >> 1
+            if data[parent] <= key:
                 break
-            self._swap(parent, idx)
+            data[idx] = data[parent]
             idx = parent
+        data[idx] = key
 
     def _bubble_down(self, idx):
-        n = len(self.data)
+        data = self.data
+        n = len(data)
+        key = data[idx]
         while True:
-            left = 2 * idx + 1
-            right = 2 * idx + 2
-            smallest = idx
-
-            if left < n and self.data[left][0] < self.data[smallest][0]:
-                smallest = left
-            if right < n and self.data[right][0] < self.data[smallest][0]:
-                smallest = right
-            if smallest == idx:
+            child = 2 * idx + 1
+            if child >= n:
                 break
-            self._swap(idx, smallest)
-            idx = smallest
+            right = child + 1
+            if right < n and data[right] < data[child]:
+                child = right
+            if key <= data[child]:
+                break
+            data[idx] = data[child]
+            idx = child
+        data[idx] = key
+
+
+class RadixHeap:
+    # radix heap for Dijkstra: keys only ever go up (a pushed key is never
+    # smaller than the last one popped), so a key goes into the bucket of
+    # the highest bit where it differs from that last key. push is one
+    # append, and pop only has to re-sort a bucket when bucket 0 runs out
+    # (each key moves down a few times at most, never up)
+    __slots__ = ('buckets', 'last')
+
+    def __init__(self, bits):
+        # bits = bit length of the biggest key that can be pushed
+        self.buckets = [[] for _ in range(bits + 1)]
+        self.last = 0
+
+    def push(self, key):
+        self.buckets[(key ^ self.last).bit_length()].append(key)
+
+    def pop(self):
+        buckets = self.buckets
+        if not buckets[0]:
+            # smallest key is in the first non-empty bucket; make it the new
+            # "last" and spread that bucket over the lower ones
+            i = 1
+            n = len(buckets)
+            while i < n and not buckets[i]:
+                i += 1
+            if i == n:
+                return None
+            bucket = buckets[i]
+            last = min(bucket)
+            self.last = last
+            for key in bucket:
+                buckets[(key ^ last).bit_length()].append(key)
+            bucket.clear()
+        return buckets[0].pop()
 
 
 # BFS: unweighted shortest path
 
 class BFS(PathFinder):
-    def find_path(self, start, goal):
+    def find_path(self, start, goal, fast_path=False):
         if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
             return None
 
+        if fast_path and self.grid.is_fully_open():
+            # nothing in the way: go along the column, then along the row.
+            # No cell was searched, so explored stays 0 (off by default, so
+            # the GUI's explored counts always come from a real search)
+            self.explored_nodes = 0
+            return self.straight_path(start, goal)
+
         self.explored_nodes = 0
+        neighbors = self.grid.neighbor_table()
         visited = [False] * self.size
         parent = [-1] * self.size
 
         start_idx = self.index(*start)
         goal_idx = self.index(*goal)
 
-        queue = [start_idx]
+        queue, head, tail = self.grid.make_frontier()
+        queue[tail] = start_idx
+        tail += 1
         visited[start_idx] = True
-        head = 0
+        explored = 0
 
-        while head < len(queue):
+        while head < tail:
             current_idx = queue[head]
             head += 1
-            self.explored_nodes += 1
+            explored += 1
 
             if current_idx == goal_idx:
+                self.explored_nodes = explored
                 return self.reconstruct_path(parent, start_idx, goal_idx)
 
-            row, col = self.pos(current_idx)
-            for n_row, n_col in self.grid.get_neighbors(row, col):
-                n_idx = self.index(n_row, n_col)
+            for n_idx in neighbors[current_idx]:
                 if not visited[n_idx]:
                     visited[n_idx] = True
                     parent[n_idx] = current_idx
-                    queue.append(n_idx)
+                    queue[tail] = n_idx
+                    tail += 1
+
+        self.explored_nodes = explored
+        return None
+
+    def straight_path(self, start, goal):
+        (start_row, start_col), (goal_row, goal_col) = start, goal
+        row_step = 1 if goal_row >= start_row else -1
+        col_step = 1 if goal_col >= start_col else -1
+        path = [(r, start_col) for r in range(start_row, goal_row + row_step, row_step)]
+        path += [(goal_row, c) for c in range(start_col + col_step, goal_col + col_step, col_step)]
+        return path
+
+
+# Bidirectional BFS: one search from start, one from goal, they meet in
+# the middle so each side only covers about half the distance
+
+class BiBFS(PathFinder):
+    def find_path(self, start, goal):
+        if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
+            return None
+
+        self.explored_nodes = 0
+        neighbors = self.grid.neighbor_table()
+        start_idx = self.index(*start)
+        goal_idx = self.index(*goal)
 
+        if start_idx == goal_idx:
+            self.explored_nodes = 1
+            return [start]
+
+        # side 0 searches from start, side 1 from goal
+        dist = ([-1] * self.size, [-1] * self.size)
+        parent = ([-1] * self.size, [-1] * self.size)
+        dist[0][start_idx] = 0
+        dist[1][goal_idx] = 0
+        frontiers = [[start_idx], [goal_idx]]
+        explored = 0
+
+        while frontiers[0] and frontiers[1]:
+            # grow the smaller frontier by one whole layer
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            my_dist = dist[side]
+            my_parent = parent[side]
+            other_dist = dist[1 - side]
+
+            best = None
+            best_len = self.size
+            next_frontier = []
+            for current_idx in frontiers[side]:
+                explored += 1
+                next_dist = my_dist[current_idx] + 1
+                for n_idx in neighbors[current_idx]:
+                    if other_dist[n_idx] != -1 and next_dist + other_dist[n_idx] < best_len:
+                        # the searches touch here; keep the shortest meeting
+                        # edge of this layer, not just the first one
+                        best_len = next_dist + other_dist[n_idx]
+                        best = (current_idx, n_idx)
+                    if my_dist[n_idx] == -1:
+                        my_dist[n_idx] = next_dist
+                        my_parent[n_idx] = current_idx
+                        next_frontier.append(n_idx)
+
+            if best:
+                self.explored_nodes = explored
+                start_side, goal_side = best if side == 0 else best[::-1]
+                path = self._walk(parent[0], start_side)
+                path.reverse()
+                return path + self._walk(parent[1], goal_side)
+
+            frontiers[side] = next_frontier
+
+        self.explored_nodes = explored
         return None
 
+    def _walk(self, parent, idx):
+        # cells from idx back to the root of that side's search
+        cells = []
+        while idx != -1:
+            cells.append(self.pos(idx))
+            idx = parent[idx]
+        return cells
+
+
+# Bitboard BFS: every open cell is one bit of a big int, so a whole BFS
+# layer is found with a few shifts and ands over the board (done in C)
+# instead of looking at the cells one by one
+
+class BitBFS(PathFinder):
+    def find_path(self, start, goal):
+        if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
+            return None
+
+        self.explored_nodes = 0
+        width = self.width
+        last_row = self.height - 1
+        last_col = width - 1
+        start_idx = self.index(*start)
+        goal_idx = self.index(*goal)
+        goal_bit = 1 << goal_idx
+
+        # bits of the first / last column, so left and right moves can't
+        # wrap around to the next row
+        first_col_bits = int(('0' * last_col + '1') * self.height, 2)
+        last_col_bits = first_col_bits << last_col
+
+        frontier = 1 << start_idx
+        remaining = self.grid.open_bits() & ~frontier
+        layers = [frontier]
+        explored = 0
+
+        while not frontier & goal_bit:
+            explored += frontier.bit_count()
+            reach = ((frontier >> width) | (frontier << width)
+                     | ((frontier & ~first_col_bits) >> 1)
+                     | ((frontier & ~last_col_bits) << 1))
+            frontier = reach & remaining
+            if not frontier:
+                self.explored_nodes = explored
+                return None
+            remaining ^= frontier
+            layers.append(frontier)
+
+        self.explored_nodes = explored + 1
+
+        # walk back from the goal, one layer at a time
+        path = [goal]
+        current_idx = goal_idx
+        for layer in reversed(layers[:-1]):
+            row, col = divmod(current_idx, width)
+            for n_idx, inside in ((current_idx - width, row > 0),
+                                  (current_idx + width, row < last_row),
+                                  (current_idx - 1, col > 0),
+                                  (current_idx + 1, col < last_col)):
+                if inside and layer >> n_idx & 1:
+                    current_idx = n_idx
+                    break
+            path.append(self.pos(current_idx))
+        path.reverse()
+        return path
+
 
 # Dijkstra: handles weights
 
@@ -170,47 +527,133 @@ class Dijkstra(PathFinder):
             return None
 
         self.explored_nodes = 0
+        edges = self.grid.weighted_neighbor_table()
         start_idx = self.index(*start)
         goal_idx = self.index(*goal)
 
-        dist = [float('inf')] * self.size
+        dist = [self.unreached] * self.size
         parent = [-1] * self.size
         visited = [False] * self.size
 
         dist[start_idx] = 0
-        heap = MinHeap()
-        heap.push(0, start_idx)
+        # heap keys are dist << shift | cell index
+        shift = self.size.bit_length()
+        mask = (1 << shift) - 1
+        # a popped dist never goes down, so the keys suit a radix heap
+        # (about 10% faster than MinHeap on big weighted grids, no key can
+        # be bigger than unreached << shift); without costs most keys end up
+        # in the same bucket and get re-sorted over and over, so MinHeap wins
+        if self.grid.is_uniform_cost():
+            heap = MinHeap()
+        else:
+            heap = RadixHeap(shift + self.unreached.bit_length())
+        # bound methods in locals, no attribute lookups per iteration
+        push = heap.push
+        pop = heap.pop
+        push(start_idx)
+        explored = 0
 
-        while len(heap):
-            current_dist, current_idx = heap.pop()
-            if current_idx is None:
+        while True:
+            key = pop()
+            if key is None:
                 break
+            current_idx = key & mask
             if visited[current_idx]:
                 continue
 
             visited[current_idx] = True
-            self.explored_nodes += 1
+            explored += 1
 
             if current_idx == goal_idx:
+                self.explored_nodes = explored
                 return self.reconstruct_path(parent, start_idx, goal_idx)
 
-            if current_dist > dist[current_idx]:
-                continue
-
-            row, col = self.pos(current_idx)
-            for n_row, n_col in self.grid.get_neighbors(row, col):
-                n_idx = self.index(n_row, n_col)
+            current_dist = key >> shift
+            for n_idx, cost in edges[current_idx]:
                 if visited[n_idx]:
                     continue
 
-                cost = self.grid.get_cost(n_row, n_col)
                 new_dist = current_dist + cost
 
                 if new_dist < dist[n_idx]:
                     dist[n_idx] = new_dist
                     parent[n_idx] = current_idx
-                    heap.push(new_dist, n_idx)
+                    push(new_dist << shift | n_idx)
 
+        self.explored_nodes = explored
+        return None
+
+
+# Dial's algorithm: Dijkstra with one bucket per distance instead of a heap
+# (costs are small integers, so the next node is always in the next
+# non-empty bucket and there is no log factor)
+
+class DialsDijkstra(PathFinder):
+    MAX_BUCKET_WEIGHT = 16
+
+    def find_path(self, start, goal):
+        if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
+            return None
+
+        max_cost = 1 if self.grid.is_uniform_cost() else max(self.grid.raw())
+        if max_cost == 1 or max_cost > self.MAX_BUCKET_WEIGHT:
+            # every step costs 1: one bucket per BFS layer, so just run BFS;
+            # big costs: too many empty buckets to scan, the heap is cheaper
+            fallback = BFS(self.grid) if max_cost == 1 else Dijkstra(self.grid)
+            path = fallback.find_path(start, goal)
+            self.explored_nodes = fallback.explored_nodes
+            return path
+
+        self.explored_nodes = 0
+        edges = self.grid.weighted_neighbor_table()
+        start_idx = self.index(*start)
+        goal_idx = self.index(*goal)
+
+        dist = [self.unreached] * self.size
+        parent = [-1] * self.size
+        visited = [False] * self.size
+
+        dist[start_idx] = 0
+        # a new distance is at most max cost past the current one, so
+        # max cost + 1 buckets used as a ring cover every pending distance
+        ring = max_cost + 1
+        buckets = [[] for _ in range(ring)]
+        buckets[0].append(start_idx)
+        pending = 1  # entries still sitting in some bucket
+        current = 0
+        explored = 0
+
+        # costs are >= 1, so nothing is added to a bucket while it is scanned
+        while pending:
+            bucket = buckets[current % ring]
+            pending -= len(bucket)
+            for current_idx in bucket:
+                if visited[current_idx] or dist[current_idx] != current:
+                    continue
+
+                visited[current_idx] = True
+                explored += 1
+
+                if current_idx == goal_idx:
+                    self.explored_nodes = explored
+                    return self.reconstruct_path(parent, start_idx, goal_idx)
+
+                for n_idx, cost in edges[current_idx]:
+                    if visited[n_idx]:
+                        continue
+
+                    new_dist = current + cost
+
+                    if new_dist < dist[n_idx]:
+                        dist[n_idx] = new_dist
+                        parent[n_idx] = current_idx
+                        buckets[new_dist % ring].append(n_idx)
+                        pending += 1
+
+            bucket.clear()  # slot is reused for distance current + ring
+            current += 1
+
+        self.explored_nodes = explored
         return None
 
 
@@ -226,50 +669,316 @@ class AStar(PathFinder):
             return None
         
         self.explored_nodes = 0
+        # no weighted cells: every step costs 1, so the loop can use the
+        # plain neighbour table and one g for all neighbours of a cell
+        uniform = self.grid.is_uniform_cost()
+        if uniform:
+            neighbors = self.grid.neighbor_table()
+        else:
+            edges = self.grid.weighted_neighbor_table()
+        width = self.width
+        goal_row, goal_col = goal
+        # manhattan distance = row part + column part, so two small tables
+        # replace the abs() calls in the loop
+        row_h = [abs(r - goal_row) for r in range(self.height)]
+        col_h = [abs(c - goal_col) for c in range(width)]
         start_idx = self.index(*start)
         goal_idx = self.index(*goal)
 
-        g_scores = [float('inf')] * self.size  # actual cost from start
+        g_scores = [self.unreached] * self.size  # actual cost from start
         parent = [-1] * self.size
         visited = [False] * self.size
 
         g_scores[start_idx] = 0
 
+        # heap keys are (f, h, cell index) packed into one int: on equal f
+        # the cell closer to the goal comes first, otherwise ties would go
+        # to the lowest index and flood the whole f plateau
+        shift = self.size.bit_length()
+        mask = (1 << shift) - 1
+        h_shift = shift + (self.width + self.height).bit_length()
+        start_h = self.manhattan(start, goal)
         heap = MinHeap()
-        heap.push(self.manhattan(start, goal), start_idx)
+        push = heap.push
+        pop = heap.pop
+        pending = heap.data
+        push(start_h << h_shift | start_h << shift | start_idx)
+        explored = 0
         
-        while len(heap):
-            f_score, current_idx = heap.pop()
-            if current_idx is None:
-                break
+        while pending:
+            current_idx = pop() & mask
 
             if visited[current_idx]:
                 continue
             
             visited[current_idx] = True
-            self.explored_nodes += 1
+            explored += 1
             
             if current_idx == goal_idx:
+                self.explored_nodes = explored
                 return self.reconstruct_path(parent, start_idx, goal_idx)
             
-            row, col = self.pos(current_idx)
-            for n_row, n_col in self.grid.get_neighbors(row, col):
-                n_idx = self.index(n_row, n_col)
+            current_g = g_scores[current_idx]
+            if uniform:
+                tentative_g = current_g + 1
+                for n_idx in neighbors[current_idx]:
+                    if not visited[n_idx] and tentative_g < g_scores[n_idx]:
+                        g_scores[n_idx] = tentative_g
+                        parent[n_idx] = current_idx
+                        h = row_h[n_idx // width] + col_h[n_idx % width]
+                        push((tentative_g + h) << h_shift | h << shift | n_idx)
+                continue
+
+            for n_idx, cost in edges[current_idx]:
                 if visited[n_idx]:
                     continue
 
-                cost = self.grid.get_cost(n_row, n_col)
-                tentative_g = g_scores[current_idx] + cost
+                tentative_g = current_g + cost
                 
                 if tentative_g < g_scores[n_idx]:
                     g_scores[n_idx] = tentative_g
                     parent[n_idx] = current_idx
-                    f = tentative_g + self.manhattan((n_row, n_col), goal)
-                    heap.push(f, n_idx)
+                    h = row_h[n_idx // width] + col_h[n_idx % width]
+                    push((tentative_g + h) << h_shift | h << shift | n_idx)
         
+        self.explored_nodes = explored
         return None
 
 
+# Bidirectional A*: one A* from the start (aiming at the goal) and one
+# from the goal (aiming at the start), always growing the side whose best
+# f is smaller. best is the cheapest start -> goal cost seen where the two
+# sides touch; once either side's smallest f is not below it, nothing left
+# in that heap can lead to a cheaper path, so best is the answer
+
+class BidirectionalAStar(AStar):
+    def find_path(self, start, goal):
+        if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
+            return None
+
+        start_idx = self.index(*start)
+        goal_idx = self.index(*goal)
+        if start_idx == goal_idx:
+            self.explored_nodes = 1
+            return [start]
+
+        self.explored_nodes = 0
+        cells = self.grid.raw()
+        edges = self.grid.weighted_neighbor_table()
+        width = self.width
+        inf = self.unreached
+        # the same (f, h, cell) keys as A*
+        shift = self.size.bit_length()
+        mask = (1 << shift) - 1
+        h_shift = shift + (width + self.height).bit_length()
+        start_h = self.manhattan(start, goal)
+
+        sides = []
+        for root_idx, (aim_row, aim_col) in ((start_idx, goal), (goal_idx, start)):
+            g_scores = [inf] * self.size
+            g_scores[root_idx] = 0
+            heap = MinHeap()
+            heap.push(start_h << h_shift | start_h << shift | root_idx)
+            sides.append((heap, g_scores, [-1] * self.size, [False] * self.size,
+                          [abs(r - aim_row) for r in range(self.height)],
+                          [abs(c - aim_col) for c in range(width)]))
+        forward, backward = sides
+        forward_keys = forward[0].data
+        backward_keys = backward[0].data
+
+        best = inf
+        meet_idx = -1
+        explored = 0
+
+        while forward_keys and backward_keys:
+            forward_f = forward_keys[0] >> h_shift
+            backward_f = backward_keys[0] >> h_shift
+            if forward_f >= best or backward_f >= best:
+                break
+
+            if forward_f <= backward_f:
+                side, other_g, going_back = forward, backward[1], False
+            else:
+                side, other_g, going_back = backward, forward[1], True
+            heap, g_scores, parent, visited, row_h, col_h = side
+            current_idx = heap.pop() & mask
+            if visited[current_idx]:
+                continue
+
+            visited[current_idx] = True
+            explored += 1
+
+            # forwards a step costs what the next cell costs; backwards the
+            # step n -> current costs what the current cell costs
+            own_cost = 0
+            if going_back:
+                cell = cells[current_idx]
+                own_cost = cell if cell > 0 else 1
+
+            current_g = g_scores[current_idx]
+            for n_idx, cost in edges[current_idx]:
+                if visited[n_idx]:
+                    continue
+
+                tentative_g = current_g + (own_cost or cost)
+
+                if tentative_g < g_scores[n_idx]:
+                    g_scores[n_idx] = tentative_g
+                    parent[n_idx] = current_idx
+                    h = row_h[n_idx // width] + col_h[n_idx % width]
+                    heap.push((tentative_g + h) << h_shift | h << shift | n_idx)
+                    if tentative_g + other_g[n_idx] < best:
+                        best = tentative_g + other_g[n_idx]
+                        meet_idx = n_idx
+
+        self.explored_nodes = explored
+        if meet_idx == -1:
+            return None
+
+        # start -> meeting cell, then follow the backward parents to the goal
+        path = self.reconstruct_path(forward[2], start_idx, meet_idx)
+        backward_parent = backward[2]
+        current_idx = backward_parent[meet_idx]
+        while current_idx != -1:
+            path.append(self.pos(current_idx))
+            current_idx = backward_parent[current_idx]
+        return path
+
+
+# Jump Point Search: A* for grids where every step costs 1. Instead of
+# pushing every cell, it runs along straight lines and only stops at
+# "jump points" (the goal, or a cell where a wall next to the line opens
+# up a new way to go), so the heap only ever sees a few cells. This is
+# the 4-direction version: going up/down it also looks left/right from
+# every cell it passes.
+
+class JPS(AStar):
+    def find_path(self, start, goal):
+        if not self.grid.is_walkable(*start) or not self.grid.is_walkable(*goal):
+            return None
+
+        if not self.grid.is_uniform_cost():
+            # weighted cells break the "all steps equal" idea, plain A*
+            return super().find_path(start, goal)
+
+        cells = self.grid.raw()
+
+        self.explored_nodes = 0
+        width = self.width
+        height = self.height
+        goal_row, goal_col = goal
+
+        def is_open(row, col):
+            return 0 <= row < height and 0 <= col < width and cells[row * width + col] != -1
+
+        def jump_across(row, col, dc):
+            # go along the row until a jump point or a wall / the edge
+            while True:
+                col += dc
+                if not is_open(row, col):
+                    return None
+                if row == goal_row and col == goal_col:
+                    return row, col
+                if ((is_open(row - 1, col) and not is_open(row - 1, col - dc))
+                        or (is_open(row + 1, col) and not is_open(row + 1, col - dc))):
+                    return row, col
+
+        def jump_along(row, col, dr):
+            # go along the column; a cell is also a jump point when a
+            # sideways run from it finds one
+            while True:
+                row += dr
+                if not is_open(row, col):
+                    return None
+                if row == goal_row and col == goal_col:
+                    return row, col
+                if ((is_open(row, col - 1) and not is_open(row - dr, col - 1))
+                        or (is_open(row, col + 1) and not is_open(row - dr, col + 1))):
+                    return row, col
+                if jump_across(row, col, 1) or jump_across(row, col, -1):
+                    return row, col
+
+        start_idx = self.index(*start)
+        goal_idx = self.index(*goal)
+        g_scores = [self.unreached] * self.size
+        parent = [-1] * self.size
+        visited = [False] * self.size
+        g_scores[start_idx] = 0
+
+        # same (f, h, cell) keys as A*
+        shift = self.size.bit_length()
+        mask = (1 << shift) - 1
+        h_shift = shift + (width + height).bit_length()
+        start_h = self.manhattan(start, goal)
+        heap = MinHeap()
+        push = heap.push
+        pop = heap.pop
+        pending = heap.data
+        push(start_h << h_shift | start_h << shift | start_idx)
+        explored = 0
+
+        while pending:
+            current_idx = pop() & mask
+            if visited[current_idx]:
+                continue
+
+            visited[current_idx] = True
+            explored += 1
+
+            if current_idx == goal_idx:
+                self.explored_nodes = explored
+                return self.expand_path(parent, start_idx, goal_idx)
+
+            row, col = divmod(current_idx, width)
+            if current_idx == start_idx:
+                jumps = (jump_along(row, col, -1), jump_along(row, col, 1),
+                         jump_across(row, col, -1), jump_across(row, col, 1))
+            else:
+                # only keep going forward or turn, never straight back
+                p_row, p_col = divmod(parent[current_idx], width)
+                if p_row == row:
+                    dc = 1 if col > p_col else -1
+                    jumps = (jump_along(row, col, -1), jump_along(row, col, 1),
+                             jump_across(row, col, dc))
+                else:
+                    dr = 1 if row > p_row else -1
+                    jumps = (jump_across(row, col, -1), jump_across(row, col, 1),
+                             jump_along(row, col, dr))
+
+            current_g = g_scores[current_idx]
+            for jump in jumps:
+                if jump is None:
+                    continue
+                j_row, j_col = jump
+                j_idx = j_row * width + j_col
+                if visited[j_idx]:
+                    continue
+                tentative_g = current_g + abs(j_row - row) + abs(j_col - col)
+                if tentative_g < g_scores[j_idx]:
+                    g_scores[j_idx] = tentative_g
+                    parent[j_idx] = current_idx
+                    h = abs(j_row - goal_row) + abs(j_col - goal_col)
+                    push((tentative_g + h) << h_shift | h << shift | j_idx)
+
+        self.explored_nodes = explored
+        return None
+
+    def expand_path(self, parent, start_idx, goal_idx):
+        # parents are jump points on one line with each other, fill in
+        # the cells between them
+        points = self.reconstruct_path(parent, start_idx, goal_idx)
+        path = [points[0]]
+        for row, col in points[1:]:
+            last_row, last_col = path[-1]
+            step_row = (row > last_row) - (row < last_row)
+            step_col = (col > last_col) - (col < last_col)
+            while (last_row, last_col) != (row, col):
+                last_row += step_row
+                last_col += step_col
+                path.append((last_row, last_col))
+        return path
+
+
 # GUI: click to add walls, right click for start/goal
 
 class GridUI:
@@ -284,6 +993,15 @@ class GridUI:
         'path': 'yellow',
     }
     
+    # draw_grid works with one state number per cell:
+    # 0 empty, 1 wall, 2 weighted, 3 path, 4 start, 5 goal
+    STATE_COLORS = (COLORS['empty'], COLORS['wall'], COLORS['weighted'],
+                    COLORS['path'], COLORS['start'], COLORS['goal'])
+    # cell byte -> state (-1 is 0xff, 1..127 are weighted)
+    BYTE_STATES = bytes(1 if b == 0xff else 2 if 0 < b < 0x80 else 0 for b in range(256))
+    # name shown in the panel -> finder class (panel and Compare All order)
+    ALGORITHMS = {'BFS': BFS, 'Bi-BFS': BiBFS, 'Dijkstra': Dijkstra, 'A*': AStar, 'JPS': JPS}
+    
     def __init__(self, width=15, height=15):
         self.grid = GridGraph(width, height)
         self.width = width
@@ -291,7 +1009,12 @@ class GridUI:
         self.start = None
         self.goal = None
         self.current_path = None
+        self.path_mask = bytearray(width * height)  # 1 where current_path goes
         self.current_algorithm = 'BFS'
+        self.finders = self.make_finders()
+        self.compare_cache = {}  # (cells bytes, start, goal) -> results
+        self.comparing = False  # a Compare All worker is running
+        self.redraw_pending = False
         
         self.root = tk.Tk()
         self.root.title("Shortest Path on Grid")
@@ -301,6 +1024,17 @@ class GridUI:
         self.canvas = tk.Canvas(self.root, width=canvas_width, height=canvas_height, bg='white')
         self.canvas.pack(side=tk.LEFT, padx=10, pady=10)
         
+        # all cells are one image item; the grid lines never change, so
+        # they are drawn once on top of it
+        self.photo = None
+        self.image_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        for col in range(width + 1):
+            x = col * self.CELL_SIZE
+            self.canvas.create_line(x, 0, x, canvas_height, fill='gray')
+        for row in range(height + 1):
+            y = row * self.CELL_SIZE
+            self.canvas.create_line(0, y, canvas_width, y, fill='gray')
+        
         self.canvas.bind('<Button-1>', self.on_left_click)   # left click = walls
         self.canvas.bind('<Button-3>', self.on_right_click)  # right click = start/goal
         
@@ -321,7 +1055,7 @@ class GridUI:
         tk.Label(panel, text="Algorithm:", font=('Arial', 10, 'bold')).pack(pady=5)
         
         self.algo_var = tk.StringVar(value='BFS')
-        for algo in ['BFS', 'Dijkstra', 'A*']:
+        for algo in self.ALGORITHMS:
             tk.Radiobutton(panel, text=algo, variable=self.algo_var, value=algo,
                           command=lambda a=algo: self.set_algorithm(a)).pack(anchor=tk.W)
         
@@ -338,36 +1072,74 @@ class GridUI:
         comp_frame.pack(pady=10, fill=tk.BOTH)
         comp_text = tk.Text(comp_frame, height=5, width=25)
         comp_text.pack(padx=5, pady=5)
-        comp_text.insert(tk.END, "BFS: O(V+E)\nDijkstra: O((V+E)logV)\nA*: O((V+E)logV)")
+        comp_text.insert(tk.END, "BFS: O(V+E)\nBi-BFS: O(V+E)\nDijkstra: O((V+E)logV)\nA*: O((V+E)logV)\nJPS: O((V+E)logV)")
         comp_text.config(state=tk.DISABLED)
     
     def set_algorithm(self, algo):
+        # re-clicking the selected radio button changes nothing, keep the path
+        if algo == self.current_algorithm:
+            return
         self.current_algorithm = algo
         self.clear_path()
     
+    def cell_color(self, row, col):
+        if self.start and (row, col) == self.start:
+            return self.COLORS['start']
+        elif self.goal and (row, col) == self.goal:
+            return self.COLORS['goal']
+        elif self.path_mask[row * self.width + col]:
+            return self.COLORS['path']
+        elif self.grid.get_cell(row, col) == -1:
+            return self.COLORS['wall']
+        elif (self.grid.get_cell(row, col) or 0) > 0:
+            return self.COLORS['weighted']
+        return self.COLORS['empty']
+    
     def draw_grid(self):
-        self.canvas.delete("all")
-        for row in range(self.height):
-            for col in range(self.width):
-                x1 = col * self.CELL_SIZE
-                y1 = row * self.CELL_SIZE
-                x2 = x1 + self.CELL_SIZE
-                y2 = y1 + self.CELL_SIZE
-                
-                if self.start and (row, col) == self.start:
-                    color = self.COLORS['start']
-                elif self.goal and (row, col) == self.goal:
-                    color = self.COLORS['goal']
-                elif self.current_path and (row, col) in self.current_path:
-                    color = self.COLORS['path']
-                elif self.grid.get_cell(row, col) == -1:
-                    color = self.COLORS['wall']
-                elif (self.grid.get_cell(row, col) or 0) > 0:
-                    color = self.COLORS['weighted']
-                else:
-                    color = self.COLORS['empty']
-                
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='gray')
+        # paint a width x height picture (one pixel per cell) with a single
+        # put, then zoom it up to cell size; way cheaper than one canvas
+        # rectangle per cell
+        width = self.width
+        states = bytearray(self.grid.raw().tobytes().translate(self.BYTE_STATES))
+        for row, col in self.current_path or ():
+            states[row * width + col] = 3
+        if self.goal:
+            states[self.grid.flat(*self.goal)] = 5
+        if self.start:
+            states[self.grid.flat(*self.start)] = 4
+        colors = [self.STATE_COLORS[state] for state in states]
+        rows = ['{' + ' '.join(colors[r * width:(r + 1) * width]) + '}'
+                for r in range(self.height)]
+        small = tk.PhotoImage(width=self.width, height=self.height)
+        small.put(' '.join(rows))
+        photo = small.zoom(self.CELL_SIZE)
+        self.canvas.itemconfig(self.image_item, image=photo)
+        self.photo = photo  # Tk drops the image if nothing keeps a reference
+    
+    def set_path(self, path):
+        # keep the mask in sync so "is this cell on the path" is O(1)
+        self.path_mask = bytearray(self.width * self.height)
+        for row, col in path or ():
+            self.path_mask[row * self.width + col] = 1
+        self.current_path = path
+    
+    def request_redraw(self):
+        # several changes in one event (clear + load, find after clear, ...)
+        # only need one repaint, so paint once when Tk is idle
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        self.redraw_pending = False
+        self.draw_grid()
+    
+    def repaint_cell(self, row, col):
+        # recolor just this cell's square of the image
+        x1 = col * self.CELL_SIZE
+        y1 = row * self.CELL_SIZE
+        self.photo.put(self.cell_color(row, col),
+                       to=(x1, y1, x1 + self.CELL_SIZE, y1 + self.CELL_SIZE))
     
     def on_left_click(self, event):
         col = event.x // self.CELL_SIZE
@@ -376,8 +1148,11 @@ class GridUI:
         if 0 <= row < self.height and 0 <= col < self.width:
             cell = self.grid.get_cell(row, col)
             self.grid.set_cell(row, col, 0 if cell == -1 else -1)
-            self.clear_path()
-            self.draw_grid()
+            if self.current_path:
+                self.clear_path()  # old path may be wrong now
+            else:
+                self.info_label.config(text="")
+            self.repaint_cell(row, col)
     
     def on_right_click(self, event):
         col = event.x // self.CELL_SIZE
@@ -386,29 +1161,29 @@ class GridUI:
         if 0 <= row < self.height and 0 <= col < self.width:
             if not self.start:
                 self.start = (row, col)
+                self.repaint_cell(row, col)
             elif not self.goal:
                 self.goal = (row, col)
-                self.find_path()
+                self.repaint_cell(row, col)
+                self.find_path()  # repaints the new path
             else:
+                old_start, old_goal = self.start, self.goal
                 self.start = (row, col)
                 self.goal = None
-            self.draw_grid()
+                for cell in (old_start, old_goal, self.start):
+                    self.repaint_cell(*cell)
     
     def find_path(self):
         if not self.start or not self.goal:
             messagebox.showwarning("Warning", "Set start and goal first")
             return
         
-        if self.current_algorithm == 'BFS':
-            pf = BFS(self.grid)
-        elif self.current_algorithm == 'Dijkstra':
-            pf = Dijkstra(self.grid)
-        else:
-            pf = AStar(self.grid)
-        
-        t0 = time.time()
-        self.current_path = pf.find_path(self.start, self.goal)
-        elapsed = (time.time() - t0) * 1000
+        pf = self.finders[self.current_algorithm]
+        pf.reset()
+        t0 = time.perf_counter_ns()
+        path = pf.find_path(self.start, self.goal)
+        elapsed = (time.perf_counter_ns() - t0) / 1e6
+        self.show_path(path)
         
         if self.current_path:
             info = f"Algorithm: {self.current_algorithm}\n"
@@ -422,54 +1197,119 @@ class GridUI:
             info += f"Time: {elapsed:.2f} ms"
         
         self.info_label.config(text=info)
-        self.draw_grid()
+    
+    def show_path(self, path):
+        # switch to a new path (or None) and repaint only the cells that
+        # are on exactly one of the old and new path
+        old_path = self.current_path
+        old_mask = self.path_mask
+        self.set_path(path)
+        if self.photo is None or self.redraw_pending:
+            self.request_redraw()  # full repaint coming anyway
+            return
+        new_mask = self.path_mask
+        width = self.width
+        changed = [(row, col) for row, col in old_path or () if not new_mask[row * width + col]]
+        changed += [(row, col) for row, col in path or () if not old_mask[row * width + col]]
+        if len(changed) * 4 > self.width * self.height:
+            self.request_redraw()  # most of the grid anyway, one big put is cheaper
+            return
+        for row, col in changed:
+            self.repaint_cell(row, col)
     
     def clear_path(self):
-        self.current_path = None
+        self.show_path(None)
         self.info_label.config(text="")
-        self.draw_grid()
+    
+    def make_finders(self):
+        # one finder per algorithm, rebuilt only when the grid object changes
+        return {name: cls(self.grid) for name, cls in self.ALGORITHMS.items()}
     
     def clear_all(self):
         self.grid = GridGraph(self.width, self.height)
+        self.finders = self.make_finders()
         self.start = None
         self.goal = None
-        self.current_path = None
+        self.set_path(None)
         self.info_label.config(text="")
-        self.draw_grid()
+        self.request_redraw()
     
     def load_example(self):
         self.clear_all()
         
-        for row in range(self.height):
-            if row != self.height // 2:
-                self.grid.set_cell(row, self.width // 3, -1)
-                self.grid.set_cell(row, 2 * self.width // 3, -1)
-        
-        for col in range(self.width):
-            if col != self.width // 2:
-                self.grid.set_cell(self.height // 3, col, -1)
+        # two wall columns with a gap in the middle row,
+        # one wall row with a gap in the middle column
+        grid = self.grid
+        for col in (self.width // 3, 2 * self.width // 3):
+            grid.fill_col(col, -1)
+            grid.set_cell(self.height // 2, col, 0)
+        grid.fill_row(self.height // 3, -1)
+        grid.set_cell(self.height // 3, self.width // 2, 0)
         
         self.start = (0, 0)
         self.goal = (self.height - 1, self.width - 1)
-        self.draw_grid()
+        self.request_redraw()
     
     def compare_algorithms(self):
+        # one worker at a time; clicks while it runs are ignored
+        if self.comparing:
+            return
         if not self.start or not self.goal:
             messagebox.showwarning("Warning", "Set start and goal first")
             return
         
-        results = {}
-        for name, cls in [('BFS', BFS), ('Dijkstra', Dijkstra), ('A*', AStar)]:
-            pf = cls(self.grid)
-            t0 = time.time()
-            path = pf.find_path(self.start, self.goal)
-            elapsed = (time.time() - t0) * 1000
-            results[name] = {
-                'path': len(path) if path else 'N/A',
-                'explored': pf.explored_nodes,
-                'time': elapsed
-            }
+        # same walls/costs and endpoints as a previous run -> same answer;
+        # any cell edit changes the bytes, so the key can't go stale
+        key = (self.grid.cells.tobytes(), self.start, self.goal)
+        if key in self.compare_cache:
+            self.show_comparison(self.compare_cache[key])
+            return
         
+        # the searches only read the grid, so run them on a copy in a worker
+        # thread and keep the window responsive; results come back through
+        # root.after so only the main thread touches the widgets
+        self.info_label.config(text="Comparing...")
+        self.comparing = True
+        worker = threading.Thread(target=self.run_comparison,
+                                  args=(self.grid.copy(), self.start, self.goal, key),
+                                  daemon=True)
+        worker.start()
+    
+    def run_comparison(self, grid, start, goal, key):
+        results = None  # stays None if a search raises
+        try:
+            done = {}
+            for name, cls in self.ALGORITHMS.items():
+                pf = cls(grid)
+                t0 = time.perf_counter_ns()
+                path = pf.find_path(start, goal)
+                elapsed = (time.perf_counter_ns() - t0) / 1e6
+                done[name] = {
+                    'path': len(path) if path else 'N/A',
+                    'explored': pf.explored_nodes,
+                    'time': elapsed
+                }
+            results = done
+        finally:
+            # always report back (the error itself still goes to the console),
+            # otherwise comparing stays True and the label stays "Comparing..."
+            self.root.after(0, self.store_comparison, key, results)
+    
+    def store_comparison(self, key, results):
+        self.comparing = False
+        if results is None:
+            self.info_label.config(text="Compare All failed\n(see console)")
+            return
+        if len(self.compare_cache) >= 64:
+            self.compare_cache.clear()
+        self.compare_cache[key] = results
+        # the user may have changed the grid or start/goal while the worker
+        # ran; then these numbers are for a grid that isn't shown anymore
+        # (still cached, in case it comes back)
+        if key == (self.grid.cells.tobytes(), self.start, self.goal):
+            self.show_comparison(results)
+    
+    def show_comparison(self, results):
         info = "Comparison:\n\n"
         for name, data in results.items():
             info += f"{name}:\n"
@@ -499,7 +1339,7 @@ def console_demo():
     goal = (0, 7)
     
     print("\nGrid (. = empty, # = wall):")
-    for row in grid.grid:
+    for row in grid.rows():
         print(' '.join('#' if c == -1 else '.' for c in row))
     
     print(f"\nStart: {start}")
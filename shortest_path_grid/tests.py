@@ -1,11 +1,12 @@
 # Small tests for our path code
 
 import unittest
-from main import GridGraph, BFS, Dijkstra, AStar
+from array import array
+from main import GridGraph, RadixHeap, BFS, BiBFS, BitBFS, Dijkstra, DialsDijkstra, AStar, JPS, BidirectionalAStar
 
 
 def print_grid_simple(grid):
-    for row in grid.grid:
+    for row in grid.rows():
         line = " ".join("#" if c == -1 else "." if c == 0 else str(c) for c in row)
         print(line)
 
@@ -91,6 +92,260 @@ class PathTests(unittest.TestCase):
         self.assertEqual(path[0], (0, 0))
         self.assertEqual(path[-1], (4, 4))
 
+    # test 6: same 3x2 grid as test 4
+    # Dial's bucket version should pick the same cheap detour as Dijkstra
+    def test_6_dials_matches_dijkstra(self):
+        grid = GridGraph(3, 2)
+        grid.set_cell(0, 1, 10)
+        start, goal = (0, 0), (0, 2)
+        print("\nTest 6 - Dial's Dijkstra on weighted grid (3x2)")
+        print("Grid:")
+        print_grid_simple(grid)
+        path = DialsDijkstra(grid).find_path(start, goal)
+        print("Found path:", path)
+        self.assertEqual(path, Dijkstra(grid).find_path(start, goal))
+        self.assertEqual(path, [(0, 0), (1, 0), (1, 1), (1, 2), (0, 2)])
+
+    # test 7: 5x5 grid with a wall column that has one gap at the bottom
+    # S . # . G
+    # . . # . .
+    # . . # . .
+    # . . # . .
+    # . . . . .
+    # bidirectional BFS must be as short as normal BFS
+    def test_7_bidirectional_bfs(self):
+        grid = GridGraph(5, 5)
+        for r in range(4):
+            grid.set_cell(r, 2, -1)
+        start, goal = (0, 0), (0, 4)
+        print("\nTest 7 - bidirectional BFS around a wall")
+        print("Grid:")
+        print_grid_simple(grid)
+        path = BiBFS(grid).find_path(start, goal)
+        print("Found path:", path)
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        self.assertEqual(len(path), len(BFS(grid).find_path(start, goal)))
+        self.assertIn((4, 2), path)  # only way through
+
+    # test 8: 4x6 grid with no walls at all
+    # with fast_path BFS skips the search and walks straight there (same
+    # length as a search, explored stays 0); by default it really searches
+    def test_8_open_grid_fast_path(self):
+        grid = GridGraph(4, 6)
+        start, goal = (5, 3), (0, 0)
+        print("\nTest 8 - BFS fast path on a grid without walls")
+        bfs = BFS(grid)
+        path = bfs.find_path(start, goal, fast_path=True)
+        print("Found path:", path)
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        self.assertEqual(len(path), 5 + 3 + 1)
+        self.assertEqual(bfs.explored_nodes, 0)
+        self.assertEqual(len(path), len(bfs.find_path(start, goal)))
+        self.assertGreater(bfs.explored_nodes, 0)
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+
+    # test 9: 4x4 grid, walls force a zig-zag
+    # S . . .
+    # # # # .
+    # . . . .
+    # . # # #
+    # goal is (3, 0); bitboard BFS must match normal BFS, and a fully
+    # walled-off goal must give None
+    def test_9_bitboard_bfs(self):
+        grid = GridGraph(4, 4)
+        for c in range(3):
+            grid.set_cell(1, c, -1)
+        for c in range(1, 4):
+            grid.set_cell(3, c, -1)
+        start, goal = (0, 0), (3, 0)
+        print("\nTest 9 - bitboard BFS on a zig-zag")
+        print("Grid:")
+        print_grid_simple(grid)
+        path = BitBFS(grid).find_path(start, goal)
+        print("Found path:", path)
+        self.assertEqual(path, BFS(grid).find_path(start, goal))
+        grid.set_cell(2, 0, -1)
+        self.assertIsNone(BitBFS(grid).find_path(start, goal))
+
+    # test 10: grid built straight from a flat cell list
+    # S # .
+    # . # .
+    # . . G
+    # from_cells must keep the given array (no copy) and count the walls;
+    # copy() must not share cells with the original
+    def test_10_grid_from_cells(self):
+        cells = array('b', [0, -1, 0,
+                            0, -1, 0,
+                            0, 0, 0])
+        grid = GridGraph.from_cells(3, 3, cells)
+        print("\nTest 10 - grid from a flat cell array")
+        print_grid_simple(grid)
+        self.assertIs(grid.raw(), cells)
+        self.assertEqual(grid.grid, [[0, -1, 0], [0, -1, 0], [0, 0, 0]])
+        self.assertEqual(grid.wall_count, 2)
+        path = BFS(grid).find_path((0, 0), (0, 2))
+        print("Found path:", path)
+        self.assertEqual(len(path), 7)
+        other = grid.copy()
+        other.set_cell(2, 1, -1)
+        self.assertEqual(grid.get_cell(2, 1), 0)
+        self.assertIsNone(BFS(other).find_path((0, 0), (0, 2)))
+        self.assertRaises(ValueError, GridGraph.from_cells, 3, 2, cells)
+        # every BFS gets its own queue buffer (safe for searches in threads)
+        self.assertIsNot(grid.make_frontier()[0], grid.make_frontier()[0])
+
+    # test 11: empty 8x8 grid, corner to corner
+    # every cell with g + h = 14 ties on f, so without tie-breaking A*
+    # could look at the whole grid; preferring small h means it only
+    # touches the cells of the path itself
+    def test_11_astar_tie_break(self):
+        grid = GridGraph(8, 8)
+        start, goal = (0, 0), (7, 7)
+        print("\nTest 11 - A* tie-break on an empty grid")
+        astar = AStar(grid)
+        path = astar.find_path(start, goal)
+        print("Found path:", path, "explored:", astar.explored_nodes)
+        self.assertEqual(len(path), 15)
+        self.assertEqual(astar.explored_nodes, len(path))
+
+    # test 12: 7x7 grid with two walls that have a gap at opposite ends
+    # S . . . . . .
+    # # # # # # . #
+    # . . . . . . .
+    # . . . . . . .
+    # # . # # # # #
+    # . . . . . . .
+    # . . . . . . G
+    # JPS must give a path as short as BFS, step by step, and fall back
+    # to A* once a cell has a cost
+    def test_12_jump_point_search(self):
+        grid = GridGraph(7, 7)
+        grid.fill_row(1, -1)
+        grid.set_cell(1, 5, 0)
+        grid.fill_row(4, -1)
+        grid.set_cell(4, 1, 0)
+        start, goal = (0, 0), (6, 6)
+        print("\nTest 12 - jump point search")
+        print_grid_simple(grid)
+        jps = JPS(grid)
+        path = jps.find_path(start, goal)
+        print("Found path:", path, "explored:", jps.explored_nodes)
+        self.assertEqual(len(path), len(BFS(grid).find_path(start, goal)))
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+            self.assertTrue(grid.is_walkable(r2, c2))
+        grid.set_cell(2, 5, 9)
+        path = JPS(grid).find_path(start, goal)
+        self.assertEqual(path, AStar(grid).find_path(start, goal))
+
+    # test 13: 5x5 grid, a costly middle column with one cheap cell
+    # S . 9 . .
+    # . . 9 . .
+    # . . . . .
+    # . . 9 . .
+    # . . 9 . G
+    # bidirectional A* must find a path as cheap as Dijkstra's (through
+    # the gap), also when start and goal are swapped
+    def test_13_bidirectional_astar(self):
+        grid = GridGraph(5, 5)
+        for r in (0, 1, 3, 4):
+            grid.set_cell(r, 2, 9)
+        print("\nTest 13 - bidirectional A*")
+        print_grid_simple(grid)
+        for start, goal in (((0, 0), (4, 4)), ((4, 4), (0, 0))):
+            path = BidirectionalAStar(grid).find_path(start, goal)
+            print("Found path:", path)
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], goal)
+            self.assertIn((2, 2), path)
+            cost = sum(grid.get_cost(r, c) for r, c in path[1:])
+            best = Dijkstra(grid).find_path(start, goal)
+            self.assertEqual(cost, sum(grid.get_cost(r, c) for r, c in best[1:]))
+        self.assertEqual(BidirectionalAStar(grid).find_path((1, 1), (1, 1)), [(1, 1)])
+
+    # test 14: the grid keeps track of weighted cells, so "all steps cost
+    # 1" is known without scanning; A* must give the same answer either way
+    def test_14_uniform_cost_flag(self):
+        grid = GridGraph(4, 3)
+        print("\nTest 14 - uniform cost flag")
+        self.assertTrue(grid.is_uniform_cost())
+        grid.set_cell(1, 1, 5)
+        self.assertFalse(grid.is_uniform_cost())
+        grid.set_cell(1, 1, -1)
+        self.assertTrue(grid.is_uniform_cost())
+        grid.fill_row(2, 3)
+        self.assertFalse(grid.is_uniform_cost())
+        grid.fill_row(2, 0)
+        self.assertTrue(grid.is_uniform_cost())
+        path = AStar(grid).find_path((0, 0), (2, 3))
+        print("Found path:", path)
+        self.assertEqual(len(path), len(BFS(grid).find_path((0, 0), (2, 3))))
+
+    # test 15: radix heap gives keys back smallest first as long as no
+    # key pushed is smaller than the last one popped (like in Dijkstra)
+    def test_15_radix_heap(self):
+        heap = RadixHeap(8)
+        print("\nTest 15 - radix heap")
+        for key in (7, 3, 200, 4, 64):
+            heap.push(key)
+        out = [heap.pop(), heap.pop()]
+        heap.push(5)
+        heap.push(130)
+        while True:
+            key = heap.pop()
+            if key is None:
+                break
+            out.append(key)
+        print("Popped:", out)
+        self.assertEqual(out, [3, 4, 5, 7, 64, 130, 200])
+
+    # test 16: 1x3 grid, wall in the middle
+    #   S # G
+    # a cost that doesn't fit in a byte is rejected and must not change
+    # the wall / cost counters (BFS trusts them to skip the search)
+    def test_16_rejected_write_keeps_counts(self):
+        grid = GridGraph(3, 1)
+        grid.set_cell(0, 1, -1)
+        print("\nTest 16 - rejected write")
+        with self.assertRaises(OverflowError):
+            grid.set_cell(0, 1, 200)
+        self.assertEqual(grid.get_cell(0, 1), -1)
+        self.assertEqual(grid.wall_count, 1)
+        self.assertEqual(grid.weighted_count, 0)
+        self.assertIsNone(BFS(grid).find_path((0, 0), (0, 2)))
+        grid.set_cell(0, 1, 5)
+        with self.assertRaises(OverflowError):
+            grid.set_cell(0, 1, 128)
+        self.assertEqual(grid.wall_count, 0)
+        self.assertEqual(grid.weighted_count, 1)
+        self.assertFalse(grid.is_uniform_cost())
+
+    # test 17: 3x2 grid, like test 14 but with odd negative values
+    # . . 4
+    # -7 . .
+    # only a cost > 0 makes a cell weighted (anything below 0 other than
+    # -1 is walked like an empty cell); set_cell, fill_row and from_cells
+    # must all count the same way
+    def test_17_weighted_count_rule(self):
+        print("\nTest 17 - same weighted count for every kind of write")
+        grid = GridGraph(3, 2)
+        grid.set_cell(1, 0, -7)
+        self.assertTrue(grid.is_uniform_cost())
+        grid.set_cell(0, 2, 4)
+        self.assertEqual(grid.weighted_count, 1)
+        bulk = GridGraph.from_cells(3, 2, grid.raw())
+        self.assertEqual(bulk.weighted_count, 1)
+        self.assertEqual(bulk.wall_count, 0)
+        grid.fill_row(1, -7)
+        self.assertEqual(grid.weighted_count, 1)
+        grid.fill_row(0, 0)
+        self.assertTrue(grid.is_uniform_cost())
+        grid.fill_col(2, 127)
+        self.assertEqual(grid.weighted_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,52 +1,145 @@
-# Small timing check for BFS / Dijkstra / A*
-# Run: python timing_check.py
+# Small timing check for all the finders (BFS, Bi-BFS, bitboard BFS, Dijkstra,
+# Dial's, A*, bidirectional A*, JPS)
+# Run: python timing_check.py  (--invalidate to ignore cached results, --csv to save a table)
 
-import time
-from main import GridGraph, BFS, Dijkstra, AStar
+import csv
+import hashlib
+import json
+import os
+import random
+import sys
+import timeit
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from main import GridGraph, BFS, BiBFS, BitBFS, Dijkstra, DialsDijkstra, AStar, BidirectionalAStar, JPS
 
+SIZES = [10, 20, 30]
+ALGORITHMS = [("BFS", BFS), ("BiBFS", BiBFS), ("BitBFS", BitBFS), ("Dijkstra", Dijkstra), ("Dial", DialsDijkstra), ("A*", AStar), ("BiA*", BidirectionalAStar), ("JPS", JPS)]
 
-def build_grid(n):
-    grid = GridGraph(n, n)
-    for r in range(n):
-        for c in range(n):
-            if (r + c) % 7 == 0 and (r, c) not in [(0, 0), (n - 1, n - 1)]:
-                grid.set_cell(r, c, -1)
-    # carve a guaranteed corridor: top row + rightmost column are open
-    for c in range(n):
-        grid.set_cell(0, c, 0)
-    for r in range(n):
-        grid.set_cell(r, n - 1, 0)
-    return grid
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = os.path.join(HERE, ".timing_cache.json")
+CSV_FILE = os.path.join(HERE, "timing_results.csv")
+
+
+def source_hash():
+    # cached numbers are only valid for the code that produced them
+    h = hashlib.sha1()
+    for name in ("main.py", "timing_check.py"):
+        with open(os.path.join(HERE, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def load_cache(invalidate=False):
+    if invalidate or not os.path.exists(CACHE_FILE):
+        return {}
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        # unreadable or broken cache file: just time everything again
+        return {}
+    if not isinstance(data, dict) or data.get("source") != source_hash():
+        return {}
+    return data.get("results", {})
+
+
+def save_cache(results):
+    # write a temp file and swap it in, so a run stopped halfway through
+    # saving never leaves a half-written cache behind
+    tmp = CACHE_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"source": source_hash(), "results": results}, f)
+    os.replace(tmp, CACHE_FILE)
+
+
+def write_csv(results, path=CSV_FILE):
+    # one row per (size, algorithm), for plotting in a spreadsheet
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["size", "algorithm", "path_len", "explored", "ms"])
+        for n in SIZES:
+            for name, _ in ALGORITHMS:
+                data = results[f"{name}@{n}"]
+                writer.writerow([n, name, data["path_len"], data["explored"], f"{data['ms']:.4f}"])
+
+
+def build_grid(n, seed=42):
+    # guaranteed corridor: top row + rightmost column stay open, walls go
+    # on random cells everywhere else (about 1 in 7 of them, fixed seed so
+    # every run times the same maze)
+    cells = array("b", bytes(n * n))
+    rest = [r * n + c for r in range(1, n) for c in range(n - 1)]
+    for idx in random.Random(seed).sample(rest, len(rest) // 7):
+        cells[idx] = -1
+    return GridGraph.from_cells(n, n, cells)
 
 
 def time_algo(algo_cls, grid, start, goal):
     pf = algo_cls(grid)
-    t0 = time.perf_counter()
-    path = pf.find_path(start, goal)
-    elapsed = (time.perf_counter() - t0) * 1000
+    last_path = [None]
+    # BFS may skip the search when the grid has no walls (it then reports
+    # explored=0); the GUI leaves that off
+    options = {"fast_path": True} if algo_cls is BFS else {}
+
+    def search():
+        last_path[0] = pf.find_path(start, goal, **options)
+
+    # one search is well under a millisecond, so let autorange repeat it
+    # until the total is at least 0.2s and report the average; path length
+    # and explored count come from the last of those runs
+    runs, total = timeit.Timer(search).autorange()
+    path = last_path[0]
     return {
         "path_len": len(path) if path else None,
         "explored": pf.explored_nodes,
-        "ms": elapsed,
+        "ms": total / runs * 1000,
     }
 
 
-def run_sizes():
-    for n in [10, 20, 30]:
-        grid = build_grid(n)
-        start, goal = (0, 0), (n - 1, n - 1)
-        results = {}
-        for name, cls in [("BFS", BFS), ("Dijkstra", Dijkstra), ("A*", AStar)]:
-            results[name] = time_algo(cls, grid, start, goal)
+# grids a worker process has built so far, by size; the searches only
+# read the grid, so every algorithm timed in that process can share it
+BUILT_GRIDS = {}
+
+
+def grid_for(n):
+    if n not in BUILT_GRIDS:
+        BUILT_GRIDS[n] = build_grid(n)
+    return BUILT_GRIDS[n]
+
 
+def time_job(job):
+    # runs in a worker process, so it uses that process's grids
+    n, name = job
+    cls = dict(ALGORITHMS)[name]
+    return time_algo(cls, grid_for(n), (0, 0), (n - 1, n - 1))
+
+
+def run_sizes(invalidate=False, csv_out=False):
+    cache = load_cache(invalidate)
+    jobs = [(n, name) for n in SIZES for name, _ in ALGORITHMS
+            if f"{name}@{n}" not in cache]
+    if jobs:
+        # every (size, algorithm) pair is independent, so spread them over
+        # processes (pure Python searches would just fight over the GIL in threads)
+        with ProcessPoolExecutor() as ex:
+            for (n, name), data in zip(jobs, ex.map(time_job, jobs)):
+                cache[f"{name}@{n}"] = data
+
+    for n in SIZES:
         print(f"\nGrid {n}x{n}")
-        for name in ["BFS", "Dijkstra", "A*"]:
-            data = results[name]
+        for name, _ in ALGORITHMS:
+            data = cache[f"{name}@{n}"]
             print(
                 f"{name:9}  path={data['path_len']}  explored={data['explored']}  time={data['ms']:.2f}ms"
             )
+    save_cache(cache)
+    if csv_out:
+        write_csv(cache)
+        print(f"\nSaved {CSV_FILE}")
 
 
 if __name__ == "__main__":
-    run_sizes()
-
+    # --invalidate: ignore saved results and time everything again
+    # --csv: also write the table to timing_results.csv
+    run_sizes(invalidate="--invalidate" in sys.argv, csv_out="--csv" in sys.argv)